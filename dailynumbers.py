@@ -13,7 +13,8 @@ Setup (one-time)
 4) Choose Slack auth:
    a) Incoming Webhook (simplest): set SLACK_WEBHOOK_URL
    b) Or a Slack App with chat:write: set SLACK_BOT_TOKEN and SLACK_CHANNEL_ID
-5) Set optional envs: SHEETS_CONFIG_JSON to override the config below.
+5) Set optional envs: SHEETS_CONFIG_JSON to override the config below, DAILYNUMBERS_TOKEN_CACHE to move the
+   access-token cache (default ~/.cache/dailynumbers_token).
 Run locally
 - `pip install -r requirements.txt`
 - `export GOOGLE_SERVICE_ACCOUNT_JSON='...json blob...'`
@@ -25,15 +26,22 @@ Notes
 - We compute "yesterday" in America/Denver regardless of where this runs.
 - Adjust the CONFIG to match your sheet columns (e.g., Date, Revenue, Unlimited, Washes).
 """
-import json
+from __future__ import annotations
+import functools
 import os
+import pathlib
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
 from zoneinfo import ZoneInfo
-import requests
-import pandas as pd
-import gspread
-from google.oauth2.service_account import Credentials
+import orjson
+import urllib3
 from dotenv import load_dotenv
+# pandas, gspread and google-auth cost most of the cold start, so they are imported where they are used
+if TYPE_CHECKING:
+    import gspread
+    from google.oauth2.service_account import Credentials
 load_dotenv()  # take environment variables from .env
 
 # ========== CONFIG ==========
@@ -43,184 +51,434 @@ load_dotenv()  # take environment variables from .env
 # - spreadsheet_id: the Google Sheets ID (the long hash in the URL)
 # - worksheet: tab name or gid. Prefer the tab name for clarity
 # - date_column: header name for the date column (must match the first row in the sheet)
+# - date_format: optional strptime format of the date column as displayed (e.g. "%m/%d/%Y"); skips format guessing
 # - fields: list of columns to include in the Slack summary (must match headers in the sheet)
 # Slack auth (choose one method)
 SLACK_WEBHOOK_URL = os.getenv("SLACK_WEBHOOK_URL")  # incoming webhook (simplest)
 #SLACK_BOT_TOKEN = os.getenv("SLACK_BOT_TOKEN")      # xoxb-...*
 #SLACK_CHANNEL_ID = os.getenv("SLACK_CHANNEL_ID")    # e.g. C0123456789
+# A bare urllib3 pool is all the webhook POSTs need
+SLACK_HTTP = urllib3.PoolManager()
+# Slack rejects messages over 50 blocks, so longer summaries go out as several messages
+SLACK_MAX_BLOCKS = 50
+# Attempts per message when Slack answers 429
+SLACK_MAX_RETRIES = 3
 # Optional: override CONFIG via env var (handy for GitHub Actions secrets)
+CONFIG = []
 if os.getenv("SHEETS_CONFIG_JSON"):
-    CONFIG = json.loads(os.getenv("SHEETS_CONFIG_JSON"))
+    CONFIG = orjson.loads(os.getenv("SHEETS_CONFIG_JSON"))
 else:
-    import pathlib
     cfg_path = pathlib.Path(__file__).with_name("config.json")
     if cfg_path.exists():
-        CONFIG = json.loads(cfg_path.read_text(encoding="utf-8"))
+        CONFIG = orjson.loads(cfg_path.read_bytes())
         print(f"Loaded {len(CONFIG)} locations from config.json")
 
+def is_money_label(label: str) -> bool:
+    # Currency-style formatting if label hints at money
+    return "$" in label or "revenue" in label.lower()
+def prepare_config(config: list[dict]) -> list[dict]:
+    # Interpret each entry's field specs once at load, so a run only walks ready-made extractors:
+    # ("key", label, is_money, lower_key) or ("sum", label, is_money, [lower_keys]).
+    # A malformed spec doesn't stop the run: it is kept as "_error" and reported for that location only
+    prepared = []
+    for cfg in config:
+        extractors = []
+        error = None
+        try:
+            for f in cfg.get("fields", []):
+                # Case 1: simple string field
+                if isinstance(f, str):
+                    extractors.append(("key", f, is_money_label(f), f.strip().lower()))
+                # Case 2: object with "key" and optional "label"
+                elif isinstance(f, dict) and "key" in f:
+                    key = str(f["key"]).strip().lower()
+                    label = f.get("label", key)
+                    extractors.append(("key", label, is_money_label(str(label)), key))
+                # Case 3: computed sum of multiple columns
+                elif isinstance(f, dict) and "sum" in f:
+                    label = f.get("label", "Sum")
+                    keys = [str(k).strip().lower() for k in f["sum"]]
+                    extractors.append(("sum", label, is_money_label(str(label)), keys))
+                # Unrecognized field specs are skipped
+        except Exception as e:
+            error = e
+        prepared.append({
+            **cfg,
+            "_title": cfg.get("title", cfg.get("worksheet", "Sheet")),
+            "_extractors": extractors,
+            "_error": error,
+        })
+    return prepared
+CONFIG = prepare_config(CONFIG)
+
+# Read cells as displayed, so currency/percent cells reach Slack as the sheet shows them ("$1,234.50", "45.00%")
+VALUE_PARAMS = {"valueRenderOption": "FORMATTED_VALUE"}
+# Date layouts tried as plain string matches when a sheet has no date_format. Only ISO: slash dates are
+# ambiguous (day- vs month-first), so those are left to the parser unless date_format says which
+DEFAULT_DATE_FORMATS = ("%Y-%m-%d",)
+# Upper bound on workbooks fetched in parallel
+MAX_WORKERS = 8
+
+# Sheets access for the service account
+SCOPES = [
+    "https://www.googleapis.com/auth/spreadsheets.readonly",
+    "https://www.googleapis.com/auth/drive.readonly",
+]
+# Access tokens are cached here between runs and reused until they are this close to expiring
+TOKEN_CACHE_PATH = pathlib.Path(os.getenv("DAILYNUMBERS_TOKEN_CACHE", "~/.cache/dailynumbers_token")).expanduser()
+# (must exceed google-auth's 3m45s refresh threshold, or the token would already count as expired)
+TOKEN_MIN_TTL = timedelta(minutes=5)
+
+# Tab titles per spreadsheet_id, keyed by "gid:<id>"; see worksheet_map
+_ws_cache: dict[str, dict[str, str]] = {}
+
 # Timezone for "previous day"
 MT_TZ = ZoneInfo("America/Denver")
 
 def mountain_yesterday() -> datetime:
-    now_mt = datetime.now(MT_TZ)
     # "Previous day" at local 00:00
-    y = (now_mt - timedelta(days=1)).date()
+    y = datetime.now(MT_TZ).date() - timedelta(days=1)
     return datetime(y.year, y.month, y.day, tzinfo=MT_TZ)
+@functools.lru_cache(maxsize=None)
+def service_account_info(key_json: str) -> dict:
+    # Parse the key once per process, however many times creds are built
+    return orjson.loads(key_json)
+def load_cached_token(client_email: str | None) -> tuple[str, datetime] | None:
+    # The last run's (token, expiry) while it has life left; any unreadable cache just means a fresh sign-in
+    try:
+        cached = orjson.loads(TOKEN_CACHE_PATH.read_bytes())
+        expiry = datetime.fromisoformat(cached["expiry"])
+    except Exception:
+        return None
+    # google-auth works in naive UTC
+    now_utc = datetime.now(timezone.utc).replace(tzinfo=None)
+    if cached.get("client_email") != client_email or expiry - now_utc <= TOKEN_MIN_TTL:
+        return None
+    return cached["token"], expiry
+def save_cached_token(client_email: str | None, creds: Credentials):
+    payload = {"client_email": client_email, "token": creds.token, "expiry": creds.expiry.isoformat()}
+    try:
+        TOKEN_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        # Owner-only: this is a live bearer token
+        fd = os.open(TOKEN_CACHE_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(orjson.dumps(payload))
+    except OSError:
+        pass  # caching is best-effort (e.g. read-only home on CI)
+def forget_cached_token():
+    # Called when Google rejects our credentials, so the next run signs in from scratch
+    try:
+        TOKEN_CACHE_PATH.unlink()
+    except OSError:
+        pass
+def is_auth_error(e: Exception) -> bool:
+    from google.auth.exceptions import RefreshError
+    response = getattr(e, "response", None)
+    return isinstance(e, RefreshError) or getattr(response, "status_code", None) == 401
 def make_creds():
     # Expect full JSON in GOOGLE_SERVICE_ACCOUNT_JSON
     key_json = os.getenv("GOOGLE_SERVICE_ACCOUNT_JSON")
     if not key_json:
         raise RuntimeError("Missing env GOOGLE_SERVICE_ACCOUNT_JSON (the entire JSON key).")
-    key_dict = json.loads(key_json)
-    scopes = [
-        "https://www.googleapis.com/auth/spreadsheets.readonly",
-        "https://www.googleapis.com/auth/drive.readonly",
-    ]
-    creds = Credentials.from_service_account_info(key_dict, scopes=scopes)
-    return creds, key_dict.get("client_email")
-def fetch_sheet_df(client: gspread.Client, spreadsheet_id: str, worksheet: str) -> pd.DataFrame:
-    # Open by ID, then by worksheet name (or gid string like 'gid:123456')
-    sh = client.open_by_key(spreadsheet_id)
-    if worksheet.startswith("gid:"):
-        ws = None
-        gid = worksheet.split(":", 1)[1]
-        # gspread doesn't open by gid directly; iterate to find a match
-        for w in sh.worksheets():
-            if str(w.id) == gid:
-                ws = w
-                break
-        if ws is None:
-            raise RuntimeError(f"Worksheet with {worksheet} not found.")
+    from google.auth.transport.requests import Request
+    from google.oauth2.service_account import Credentials
+    key_dict = service_account_info(key_json)
+    client_email = key_dict.get("client_email")
+    creds = Credentials.from_service_account_info(key_dict, scopes=SCOPES)
+    cached = load_cached_token(client_email)
+    if cached is not None:
+        # Seed the service-account creds with the cached token; they can still re-sign if it's rejected
+        creds.token, creds.expiry = cached
     else:
-        ws = sh.worksheet(worksheet)
-    data = ws.get_all_records(empty2zero=False, head=1)
-    df = pd.DataFrame(data)
-    return df
-def row_for_date(df: pd.DataFrame, date_column: str, target_date: datetime) -> dict | None:
-    if date_column not in df.columns:
-        raise RuntimeError(f"Date column '{date_column}' not found. Found: {list(df.columns)}")
-    # Normalize the date column
-    dc = pd.to_datetime(df[date_column], errors="coerce").dt.date
-    mask = dc == target_date.date()
-    if not mask.any():
-        return None
-    row = df.loc[mask].iloc[0].to_dict()
-    return row
+        # Sign the JWT and exchange it now so the resulting token can be cached for the next run
+        creds.refresh(Request())
+        save_cached_token(client_email, creds)
+    return creds, client_email
+def worksheet_map(client: gspread.Client, spreadsheet_id: str) -> dict[str, str]:
+    # gid -> title for every tab of a workbook from a single metadata call, cached for the rest of the process
+    tabs = _ws_cache.get(spreadsheet_id)
+    if tabs is None:
+        tabs = {}
+        # Ask only for the tab ids and titles, not every sheet's full properties
+        meta = client.http_client.fetch_sheet_metadata(spreadsheet_id, params={"fields": "sheets.properties(sheetId,title)"})
+        for sheet in meta.get("sheets", []):
+            props = sheet["properties"]
+            tabs[f"gid:{props['sheetId']}"] = props["title"]
+        _ws_cache[spreadsheet_id] = tabs
+    return tabs
+def worksheet_title(client: gspread.Client, spreadsheet_id: str, worksheet: str) -> str:
+    # Worksheet is a tab name, or a gid string like 'gid:123456' that we map back to its title.
+    # Only the gid form needs the workbook's metadata; tab names go straight into A1 ranges
+    if not worksheet.startswith("gid:"):
+        return worksheet
+    title = worksheet_map(client, spreadsheet_id).get(worksheet)
+    if title is None:
+        raise RuntimeError(f"Worksheet with {worksheet} not found.")
+    return title
+def batch_get(client: gspread.Client, spreadsheet_id: str, ranges) -> dict:
+    # One values.batchGet for every distinct A1 range, returned as {range: valueRange}.
+    # Goes through the HTTP client by ID, so reading values never needs the workbook opened
+    ranges = list(dict.fromkeys(ranges))
+    if not ranges:
+        return {}
+    resp = client.http_client.values_batch_get(spreadsheet_id, ranges, params=VALUE_PARAMS)
+    # valueRanges come back in request order
+    return dict(zip(ranges, resp.get("valueRanges", [])))
+def batch_get_each(client: gspread.Client, spreadsheet_id: str, ranges) -> dict:
+    # Like batch_get, but if the batch is rejected (one misspelled tab fails all of it) retry range by range,
+    # so only entries on the bad tab fail; their value is the exception. Re-raises when no range works at all
+    try:
+        return batch_get(client, spreadsheet_id, ranges)
+    except Exception as batch_error:
+        results = {}
+        for rng in dict.fromkeys(ranges):
+            try:
+                results.update(batch_get(client, spreadsheet_id, [rng]))
+            except Exception as e:
+                results[rng] = e
+        if all(isinstance(vr, Exception) for vr in results.values()):
+            raise batch_error
+        return results
+def fetch_sheet_rows(client: gspread.Client, spreadsheet_id: str, cfgs: list[dict], target_date: datetime) -> list:
+    # Rather than downloading whole tabs, read one workbook in three narrow batchGets that each cover every tab:
+    # the header rows, then each tab's date column, then only the rows that matched target_date.
+    # Entries that share a tab share its ranges, so each range is requested once and fanned back out per cfg.
+    # Returns one entry per cfg: a (columns, values) pair for the row, where columns maps each lower-cased
+    # header to its position in values; None if the date isn't there; or the exception that tab hit.
+    from gspread.utils import absolute_range_name, numericise_all, rowcol_to_a1
+    out = [None] * len(cfgs)
+    titles, header_ranges = {}, {}
+    for i, cfg in enumerate(cfgs):
+        try:
+            titles[i] = worksheet_title(client, spreadsheet_id, cfg["worksheet"])
+            header_ranges[i] = absolute_range_name(titles[i], "1:1")
+        except Exception as e:
+            out[i] = e
+    header_vrs = batch_get_each(client, spreadsheet_id, header_ranges.values())
+    # From here on each entry is handled in its own try, so one bad entry (say an unparseable date_format)
+    # can't fail the others in the workbook
+    headers, date_ranges = {}, {}
+    for i, rng in header_ranges.items():
+        try:
+            if isinstance(header_vrs[rng], Exception):
+                raise header_vrs[rng]
+            header = (header_vrs[rng].get("values") or [[]])[0]
+            date_column = cfgs[i].get("date_column")
+            if date_column not in header:
+                raise RuntimeError(f"Date column '{date_column}' not found. Found: {header}")
+            col = rowcol_to_a1(1, header.index(date_column) + 1).rstrip("1")
+            headers[i] = header, header.index(date_column)
+            date_ranges[i] = absolute_range_name(titles[i], f"{col}2:{col}")
+        except Exception as e:
+            out[i] = e
+    date_vrs = batch_get(client, spreadsheet_id, date_ranges.values())
+    positions, row_ranges, row_dates = {}, {}, {}
+    for i, rng in date_ranges.items():
+        try:
+            key = (rng, cfgs[i].get("date_format"))
+            if key not in positions:
+                # Blank cells in a single-column range come back as empty rows
+                dates = [r[0] if r else "" for r in date_vrs[rng].get("values", [])]
+                pos = row_for_date(dates, target_date, key[1])
+                positions[key] = (pos, dates[pos] if pos is not None else None)
+            pos, date_cell = positions[key]
+            if pos is not None:
+                n = pos + 2  # data starts below the header row
+                row_ranges[i] = absolute_range_name(titles[i], f"{n}:{n}")
+                row_dates[i] = date_cell
+        except Exception as e:
+            out[i] = e
+    row_vrs = batch_get(client, spreadsheet_id, row_ranges.values())
+    for i, rng in row_ranges.items():
+        try:
+            header, date_pos = headers[i]
+            # The API trims trailing blanks, so pad the row back out to the header width
+            row = (row_vrs[rng].get("values") or [[]])[0][:len(header)]
+            row += [""] * (len(header) - len(row))
+            # The row was located and read in separate calls; if rows were inserted, deleted or sorted in
+            # between, this is some other day's row, so refuse it rather than report the wrong numbers
+            if row[date_pos] != row_dates[i]:
+                raise RuntimeError(
+                    f"Rows moved while reading (expected {row_dates[i]!r}, got {row[date_pos]!r}); try again"
+                )
+            columns = {str(h).lower(): pos for pos, h in enumerate(header)}
+            # Plain numbers become int/float the way get_all_records did; only this one row needs it
+            out[i] = (columns, numericise_all(row))
+        except Exception as e:
+            out[i] = e
+    return out
+def fetch_workbook(client: gspread.Client, spreadsheet_id: str, cfgs: list[dict], target_date: datetime) -> list:
+    # Like fetch_sheet_rows, but never raises: a failure is recorded against every cfg in the workbook
+    try:
+        return fetch_sheet_rows(client, spreadsheet_id, cfgs, target_date)
+    except Exception as e:
+        if is_auth_error(e):
+            forget_cached_token()
+        return [e] * len(cfgs)
+def date_strings(target_date: datetime, date_format: str | None = None) -> set[str]:
+    # The ways target_date can be displayed in the sheet, with and without zero padding
+    out = set()
+    for fmt in [date_format] if date_format else DEFAULT_DATE_FORMATS:
+        out.add(target_date.strftime(fmt))
+        out.add(target_date.strftime(fmt.replace("%m", str(target_date.month)).replace("%d", str(target_date.day))))
+    return out
+def row_for_date(dates: list, target_date: datetime, date_format: str | None = None) -> int | None:
+    # Position of the first cell in a date column that falls on target_date.
+    # Fast path: compare the displayed strings directly, no parsing needed
+    targets = date_strings(target_date, date_format)
+    for pos, v in enumerate(dates):
+        if v in targets:
+            return pos
+    # No exact match; the column may use another layout, so parse it
+    return date_index(dates, date_format).get(target_date.date())
+def date_index(dates: list, date_format: str | None = None) -> dict:
+    # Parsed date -> position of its first cell. The column is parsed once (a known format in one vectorized
+    # pass) and then any number of days can be looked up in O(1)
+    if date_format is None or date_format.startswith("%Y-%m-%d"):
+        index = iso_date_index(dates)
+        if index is not None:
+            return index
+    import pandas as pd
+    parsed = pd.to_datetime(pd.Series(dates, dtype=object), errors="coerce", format=date_format, cache=True)
+    days = parsed.dropna().dt.date
+    # Built back to front so the first cell for a repeated date wins
+    return dict(zip(days.to_numpy()[::-1], days.index.to_numpy()[::-1].tolist()))
+def iso_date_index(dates: list) -> dict | None:
+    # Same as date_index, but through ciso8601's C parser, which is far faster than pandas for ISO-8601.
+    # Returns None as soon as a non-blank cell isn't ISO so the caller can fall back to pandas
+    import ciso8601
+    index = {}
+    for pos, v in enumerate(dates):
+        if v == "":
+            continue
+        try:
+            d = ciso8601.parse_datetime(v).date()
+        except (TypeError, ValueError):
+            return None
+        index.setdefault(d, pos)
+    return index
 def slack_post_blocks(blocks: list):
     # Prefer webhook if provided
     if SLACK_WEBHOOK_URL:
-        resp = requests.post(SLACK_WEBHOOK_URL, json={"blocks": blocks})
-        if resp.status_code >= 300:
-            raise RuntimeError(f"Slack webhook failed: {resp.status_code} {resp.text}")
+        body = orjson.dumps({"blocks": blocks})
+        for attempt in range(SLACK_MAX_RETRIES):
+            resp = SLACK_HTTP.request("POST", SLACK_WEBHOOK_URL, body=body, headers={"Content-Type": "application/json"})
+            # Rate limited: wait as long as Slack asks, then try again (no point waiting after the last attempt)
+            if resp.status != 429:
+                break
+            if attempt + 1 < SLACK_MAX_RETRIES:
+                time.sleep(float(resp.headers.get("Retry-After", 1)))
+        if resp.status >= 300:
+            raise RuntimeError(f"Slack webhook failed: {resp.status} {resp.data.decode('utf-8', 'replace')}")
         return
 
     raise RuntimeError("No Slack credentials set. Provide SLACK_WEBHOOK_URL or SLACK_BOT_TOKEN+SLACK_CHANNEL_ID.")
-def build_blocks(results: list[dict], date_label: str) -> list:
-    import math
-    def _fmt_value(label: str, v):
-        # Missing/NaN
-        if v is None:
-            return "—"
-        try:
-            if isinstance(v, float) and math.isnan(v):
-                return "—"
-        except Exception:
-            pass
-        # Currency-style formatting if label hints at money
-        if isinstance(v, (int, float)) and ("$" in label or "revenue" in label.lower()):
-            return f"${float(v):,.2f}"
-        # Strip decimals if it's a whole number
-        if isinstance(v, float) and v.is_integer():
-            return str(int(v))
-        return str(v)
-    blocks = [
+def _fmt_value(is_money: bool, v) -> str:
+    # Missing/NaN (NaN is the only value not equal to itself)
+    if v is None or (isinstance(v, float) and v != v):
+        return "—"
+    if is_money and isinstance(v, (int, float)):
+        return f"${float(v):,.2f}"
+    # Strip decimals if it's a whole number
+    if isinstance(v, float) and v.is_integer():
+        return str(int(v))
+    return str(v)
+def header_blocks(date_label: str) -> list:
+    return [
         {"type": "header", "text": {"type": "plain_text", "text": f"Daily Car Wash Summary – {date_label}"}},
         {"type": "divider"}
     ]
-    for r in results:
-        title = r["title"]
-        status = r["status"]
-        fields = r.get("fields", {})
-        emoji = r.get("emoji", "📍")
-        section_text = f"{emoji} *{title}*"
-        fields_md = []
-        for k, v in fields.items():
-            fields_md.append(f"*{k}:* {_fmt_value(k, v)}")
-        if fields_md:
-            section_text += "\n" + "\n".join(fields_md)
-        if status:
-            section_text += f"\n{status}"
-        blocks.append({"type": "section", "text": {"type": "mrkdwn", "text": section_text}})
-        blocks.append({"type": "divider"})
-    return blocks
+def result_blocks(r: dict) -> list:
+    # One location's section plus the divider that follows it
+    title = r["title"]
+    status = r["status"]
+    fields = r.get("fields", [])
+    emoji = r.get("emoji", "📍")
+    # Collect the lines and join once rather than growing the string piece by piece
+    parts = [f"{emoji} *{title}*"]
+    parts.extend(f"*{label}:* {_fmt_value(is_money, v)}" for label, is_money, v in fields)
+    if status:
+        parts.append(status)
+    return [{"type": "section", "text": {"type": "mrkdwn", "text": "\n".join(parts)}}, {"type": "divider"}]
+def as_number(v) -> float:
+    # Plain numeric cells are already int/float (numericised), so only leftover text needs converting;
+    # blanks, NaN and non-numeric text count as 0
+    if isinstance(v, (int, float)):
+        return v if v == v else 0
+    if isinstance(v, str) and v:
+        try:
+            return float(v)
+        except ValueError:
+            return 0
+    return 0
+def process_cfg(cfg: dict, row: tuple[dict, list] | Exception | None) -> dict:
+    try:
+        if cfg["_error"] is not None:
+            raise cfg["_error"]
+        if isinstance(row, Exception):
+            raise row
+        if row is None:
+            return {
+                "title": cfg["_title"],
+                "status": ":warning: No row for previous day",
+            }
+        # Fields are matched case-insensitively through the header's column map; only requested cells are read
+        columns, values = row
+        # (label, is_money, value) triples, in the order the fields are configured
+        fields_out = []
+        for kind, label, is_money, spec in cfg["_extractors"]:
+            if kind == "key":
+                val = values[columns[spec]] if spec in columns else None
+            else:
+                val = float(sum(as_number(values[columns[k]]) for k in spec if k in columns))
+            fields_out.append((label, is_money, val))
+        # Add one result per sheet
+        return {
+            "title": cfg["_title"],
+            "emoji": cfg.get("emoji", "📍"),
+            "status": "",
+            "fields": fields_out,
+        }
+    except Exception as e:
+        return {
+            "title": cfg["_title"],
+            "status": f":x: Error – {e}",
+        }
 def main():
+    import gspread
     y_mt = mountain_yesterday()
-    # Cross-platform date (no %-d on Windows)
-    date_label = y_mt.strftime("%a, %b %d, %Y").replace(" 0", " ")
+    # Cross-platform date (no %-d on Windows): unpadded day and year straight from the date
+    date_label = f"{y_mt:%a}, {y_mt:%b} {y_mt.day}, {y_mt.year}"
     creds, sa_email = make_creds()
     client = gspread.authorize(creds)
-    results = []
-    for cfg in CONFIG:
-        try:
-            df = fetch_sheet_df(client, cfg["spreadsheet_id"], cfg["worksheet"])
-            row = row_for_date(df, cfg["date_column"], y_mt)
-            if row is None:
-                results.append({
-                    "title": cfg.get("title", cfg.get("worksheet", "Sheet")),
-                    "status": ":warning: No row for previous day",
-                })
-                continue
-            # Case-insensitive view of the row
-            row_l = {str(k).lower(): v for k, v in row.items()}
-            fields_cfg = cfg.get("fields", [])
-            fields_out = {}
-            for f in fields_cfg:
-                # Case 1: simple string field
-                if isinstance(f, str):
-                    key = f.strip().lower()
-                    label = f
-                    val = row_l.get(key, None)
-                # Case 2: object with "key" and optional "label"
-                elif isinstance(f, dict) and "key" in f:
-                    key = str(f["key"]).strip().lower()
-                    label = f.get("label", key)
-                    val = row_l.get(key, None)
-                # Case 3: computed sum of multiple columns
-                elif isinstance(f, dict) and "sum" in f:
-                    label = f.get("label", "Sum")
-                    keys = [str(k).strip().lower() for k in f["sum"]]
-                    vals = []
-                    for k in keys:
-                        v = row_l.get(k, 0)
-                        try:
-                            # treat blanks/None/NaN as 0
-                            if v is None or (isinstance(v, float) and pd.isna(v)) or v == "":
-                                v = 0
-                        except Exception:
-                            pass
-                        try:
-                            vals.append(float(v))
-                        except Exception:
-                            vals.append(0.0)
-                    val = sum(vals)
-                else:
-                    # Unrecognized field spec; skip it
-                    continue
-                fields_out[label] = val
-            # Add one result per sheet
-            results.append({
-                "title": cfg.get("title", cfg.get("worksheet", "Sheet")),
-                "emoji": cfg.get("emoji", "📍"), 
-                "status": "",
-                "fields": fields_out,
-            })
-        except Exception as e:
-            results.append({
-                "title": cfg.get("title", cfg.get("worksheet", "Sheet")),
-                "status": f":x: Error – {e}",
-            })
-    blocks = build_blocks(results, date_label)
-    slack_post_blocks(blocks)
+    token = creds.token
+    # Group locations by workbook so each spreadsheet is opened and read only once
+    by_sheet: dict[str, list[int]] = {}
+    for i, cfg in enumerate(CONFIG):
+        by_sheet.setdefault(cfg.get("spreadsheet_id"), []).append(i)
+    # Sheets calls are pure network wait, so read the workbooks concurrently. Locations are then reported in
+    # CONFIG order as soon as their workbook is in, and Slack is posted to whenever a message fills up, so
+    # delivery overlaps with the fetches still running
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_WORKERS, len(by_sheet)))) as ex:
+        futures = {
+            sid: ex.submit(fetch_workbook, client, sid, [CONFIG[i] for i in idxs], y_mt)
+            for sid, idxs in by_sheet.items()
+        }
+        # Where each location's row lands in its workbook's results
+        slots = {i: (sid, pos) for sid, idxs in by_sheet.items() for pos, i in enumerate(idxs)}
+        pending = header_blocks(date_label)
+        for i, cfg in enumerate(CONFIG):
+            sid, pos = slots[i]
+            section = result_blocks(process_cfg(cfg, futures[sid].result()[pos]))
+            if len(pending) + len(section) > SLACK_MAX_BLOCKS:
+                slack_post_blocks(pending)
+                pending = []
+            pending.extend(section)
+    if pending:
+        slack_post_blocks(pending)
+    # The session re-signed mid-run (cached token rejected or expired), so keep the new one for next time
+    if creds.token != token:
+        save_cached_token(sa_email, creds)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file